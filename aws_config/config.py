@@ -13,11 +13,10 @@ try:
 except ImportError:  # pragma: no cover
     import typing as T
 import os
-import copy
 import json
 import dataclasses
 from pathlib import Path
-from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
 
 from func_args.api import OPT
 from s3pathlib import S3Path
@@ -30,7 +29,7 @@ from simple_aws_ssm_parameter_store.api import (
     delete_parameter,
 )
 from which_env.api import validate_env_name, BaseEnvNameEnum
-from configcraft.api import DEFAULTS, apply_inheritance, deep_merge
+from configcraft.api import DEFAULTS, apply_inheritance
 from .vendor.strutils import slugify
 from .vendor.jsonutils import json_loads
 
@@ -48,8 +47,105 @@ T_BASE_ENV_NAME_ENUM = T.TypeVar(
     bound=BaseEnvNameEnum,
 )
 
+# resolve the enum values once at import time
+_TAG_KEY_PROJECT_NAME = AwsTagKeyEnum.project_name.value
+_TAG_KEY_ENV_NAME = AwsTagKeyEnum.env_name.value
+_TAG_KEY_CONFIG_SHA256 = AwsTagKeyEnum.config_sha256.value
 
-@dataclasses.dataclass(frozen=True)
+# max parameter value size (in bytes) of the standard tier
+_STANDARD_TIER_MAX_SIZE = 4096
+
+
+def _fast_clone(obj: T.Any) -> T.Any:
+    """
+    Recursively clone JSON-shaped data (dict, list, tuple and primitives).
+
+    Much faster than :func:`copy.deepcopy` for configuration data, because
+    config trees have no cycles and no shared mutable subtrees, so there is
+    no need for the memo table. Immutable primitives (str, int, float, bool,
+    None) are returned as is.
+    """
+    if isinstance(obj, dict):
+        return {k: _fast_clone(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [_fast_clone(v) for v in obj]
+    elif isinstance(obj, tuple):
+        return tuple(_fast_clone(v) for v in obj)
+    else:
+        return obj
+
+
+def _merge_into(
+    data1: dict,
+    data2: dict,
+    _fullpath: str = "",
+) -> dict:
+    """
+    Copy-on-write version of :func:`configcraft.api.deep_merge`.
+
+    Merge ``data2`` into ``data1`` with the same rules as ``deep_merge``
+    (recursive dict merge, positional merge for list of dict), but without
+    deep copying both inputs first. Only use it on a private copy of the data,
+    ``data1`` itself is modified and values of ``data2`` are inserted by reference.
+
+    Nested dict and list in ``data1`` are copied before they are merged into,
+    because after :func:`configcraft.api.apply_inheritance` the same object
+    from a ``*.key`` default is shared by multiple environments.
+    """
+    for key, value2 in data2.items():
+        if key not in data1:
+            data1[key] = value2
+            continue
+        value1 = data1[key]
+        if isinstance(value1, dict) and isinstance(value2, dict):
+            data1[key] = _merge_into(dict(value1), value2, f"{_fullpath}.{key}")
+        elif isinstance(value1, list) and isinstance(value2, list):
+            if len(value1) != len(value2):
+                raise ValueError(f"list length mismatch: path = '{_fullpath}.{key}'")
+            new_value1 = list()
+            for item1, item2 in zip(value1, value2):
+                if isinstance(item1, dict) and isinstance(item2, dict):
+                    new_value1.append(
+                        _merge_into(dict(item1), item2, f"{_fullpath}.{key}")
+                    )
+                else:
+                    raise TypeError(
+                        f"items in '{_fullpath}.{key}' are not dict, so you cannot merge them!"
+                    )
+            data1[key] = new_value1
+        else:
+            raise TypeError(
+                f"type of value at '{_fullpath}.{key}' in data1 and data2 "
+                f"has to be both dict or list of dict to merge! "
+                f"they are {type(value1)} and {type(value2)}."
+            )
+    return data1
+
+
+def _get_parameters(
+    ssm_client: "SSMClient",
+    names: list[str],
+    with_decryption: bool = False,
+) -> dict[str, Parameter]:
+    """
+    Get multiple SSM parameters with batched ``GetParameters`` API calls.
+
+    :return: Mapping from parameter name to :class:`Parameter`, parameters that
+        don't exist are not included.
+    """
+    parameters = {}
+    # GetParameters accepts up to 10 names per request
+    for i in range(0, len(names), 10):
+        response = ssm_client.get_parameters(
+            Names=names[i : i + 10],
+            WithDecryption=with_decryption,
+        )
+        for data in response.get("Parameters", []):
+            parameters[data["Name"]] = Parameter(_data=data)
+    return parameters
+
+
+@dataclasses.dataclass(frozen=True, eq=False, slots=True)
 class DeploymentResult:
     """
     Result of a :meth:`BaseConfig.deploy_env_parameter` operation.
@@ -117,7 +213,7 @@ class DeploymentResult:
             return self.after_param.version
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class DeleteResult:
     """
     Result of a :meth:`BaseConfig.delete_env_parameter` operation.
@@ -131,7 +227,7 @@ class DeleteResult:
     s3dir_config: S3Path | None
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class BaseConfig(
     T.Generic[T_BASE_ENV, T_BASE_ENV_NAME_ENUM],
 ):
@@ -386,9 +482,59 @@ class BaseConfig(
     EnvNameEnumClass: T.Type["T_BASE_ENV_NAME_ENUM"] = dataclasses.field()
     version: str = dataclasses.field()
 
-    _applied_data: dict = dataclasses.field(init=False)
-    _applied_secret_data: dict = dataclasses.field(init=False)
     _merged_data: dict = dataclasses.field(init=False)
+    # caches, not part of the config identity
+    _env_cache: dict = dataclasses.field(
+        init=False,
+        default_factory=dict,
+        compare=False,
+        repr=False,
+    )
+    _parameter_value_cache: dict = dataclasses.field(
+        init=False,
+        default_factory=dict,
+        compare=False,
+        repr=False,
+    )
+
+    project_name: str = dataclasses.field(init=False)
+    project_name_slug: str = dataclasses.field(init=False)
+    project_name_snake: str = dataclasses.field(init=False)
+    parameter_name: str = dataclasses.field(init=False)
+    """
+    AWS SSM Parameter Store name for consolidated multi-environment configuration.
+
+    Used for storing the complete configuration containing all environments.
+    This is typically accessed by admin tools and deployment scripts.
+
+    Pattern: "${project_name}" (no environment suffix)
+    Example: "my_project"
+
+    .. note::
+
+        If you want to use "/path/to/parameter-name" style, you can override
+        ``parameter_name`` in your subclass (e.g. as a property) to return
+        a different value.
+    """
+
+    def _init_names(self):
+        """
+        Compute the project name derived attributes once.
+
+        Attributes overridden in a subclass (e.g. ``parameter_name`` as a
+        property) are left untouched.
+        """
+        cls = type(self)
+
+        def set_name(name: str, value: str):
+            # only set the field if the subclass doesn't override it
+            if getattr(cls, name) is getattr(BaseConfig, name):
+                setattr(self, name, value)
+
+        set_name("project_name", self.data[DEFAULTS]["*.project_name"])
+        set_name("project_name_slug", slugify(self.project_name, delim="-"))
+        set_name("project_name_snake", slugify(self.project_name, delim="_"))
+        set_name("parameter_name", normalize_parameter_name(self.project_name_snake))
 
     def _validate(self):
         """
@@ -407,15 +553,21 @@ class BaseConfig(
         Process shared values and merge configuration data.
 
         Applies the shared value inheritance pattern and merges non-sensitive
-        and sensitive configuration data into a unified structure.
+        and sensitive configuration data into a unified structure. Both inputs
+        are cloned once, then inheritance and merge work in-place on the clones.
+
+        Passing an empty ``secret_data`` is the fast path, the secret inheritance
+        and merge steps are skipped entirely.
         """
-        self._applied_data = copy.deepcopy(self.data)
-        self._applied_secret_data = copy.deepcopy(self.secret_data)
+        merged_data = _fast_clone(self.data)
         # Apply shared value pattern ("*" and "env." prefixes)
-        apply_inheritance(self._applied_data)
-        apply_inheritance(self._applied_secret_data)
-        # Merge non-sensitive and sensitive data
-        self._merged_data = deep_merge(self._applied_data, self._applied_secret_data)
+        apply_inheritance(merged_data)
+        if self.secret_data:
+            secret_data = _fast_clone(self.secret_data)
+            apply_inheritance(secret_data)
+            # Merge non-sensitive and sensitive data
+            _merge_into(merged_data, secret_data)
+        self._merged_data = merged_data
 
     def __user_post_init__(self):
         """
@@ -431,40 +583,11 @@ class BaseConfig(
         Do not override this method. Use __user_post_init__ for custom logic.
         Handles validation, shared value processing, and user initialization.
         """
+        self._init_names()
         self._validate()
         self._apply_shared()
         self.__user_post_init__()
 
-    @cached_property
-    def project_name(self) -> str:
-        return self.data[DEFAULTS]["*.project_name"]
-
-    @cached_property
-    def project_name_slug(self) -> str:
-        return slugify(self.project_name, delim="-")
-
-    @cached_property
-    def project_name_snake(self) -> str:
-        return slugify(self.project_name, delim="_")
-
-    @cached_property
-    def parameter_name(self) -> str:
-        """
-        AWS SSM Parameter Store name for consolidated multi-environment configuration.
-
-        Used for storing the complete configuration containing all environments.
-        This is typically accessed by admin tools and deployment scripts.
-
-        Pattern: "${project_name}" (no environment suffix)
-        Example: "my_project"
-
-        .. note::
-
-            If you want to use "/path/to/parameter-name" style, you can override
-            this property in your environment class to return a different value.
-        """
-        return normalize_parameter_name(self.project_name_snake)
-
     def get_env(
         self,
         env_name: T.Union[str, "T_BASE_ENV_NAME_ENUM"],
@@ -475,14 +598,27 @@ class BaseConfig(
         Retrieves and deserializes configuration data for the specified environment,
         applying all shared value inheritance and merging sensitive/non-sensitive data.
 
+        The environment instance is created once per ``env_name`` and cached,
+        since the configuration is not supposed to change after initialization
+        and the environment object is immutable.
+
+        .. note::
+
+            Only the top level dict is copied before adding ``env_name``,
+            so ``EnvClass.from_dict`` must treat its input as read-only.
+
         :after_param env_name: Environment name (string) or enum value
         :return: Environment configuration instance with all values resolved
         :raises TypeError: If configuration data doesn't match environment schema
         """
         env_name = self.EnvNameEnumClass.ensure_str(env_name)
-        data = copy.deepcopy(self._merged_data[env_name])
+        if env_name in self._env_cache:
+            return self._env_cache[env_name]
+        data = dict(self._merged_data[env_name])
         data["env_name"] = env_name
-        return self.EnvClass.from_dict(data)
+        env = self.EnvClass.from_dict(data)
+        self._env_cache[env_name] = env
+        return env
 
     # --------------------------------------------------------------------------
     # Deployment
@@ -497,6 +633,28 @@ class BaseConfig(
         }
         return parameter_name, parameter_data
 
+    def _ensure_env_name(
+        self,
+        env_name: T.Union[str, "T_BASE_ENV_NAME_ENUM"],
+    ) -> str:
+        """
+        Convert an environment name or enum value to string, ALL is kept as is.
+        """
+        if env_name == ALL:
+            return ALL
+        return self.EnvNameEnumClass.ensure_str(env_name)
+
+    def _get_env_parameter_name(
+        self,
+        env_name: T.Union[str, "T_BASE_ENV_NAME_ENUM"],
+    ) -> str:
+        """
+        Get the SSM parameter name only, without building the parameter data.
+        """
+        if env_name == ALL:
+            return self.parameter_name
+        return self.get_env(env_name).parameter_name
+
     def _get_env_parameter_data(
         self,
         env_name: T.Union[str, "T_BASE_ENV_NAME_ENUM"],
@@ -506,26 +664,57 @@ class BaseConfig(
         env_name = self.EnvNameEnumClass.ensure_str(env_name)
         env = self.get_env(env_name)
         parameter_name = env.parameter_name
+        # shared keys available to this environment: "*.xyz" and "${env_name}.xyz"
+        prefixes = ("*", f"{env_name}.")
+        shared_data = self.data.get(DEFAULTS, {})
+        shared_secret_data = self.secret_data.get(DEFAULTS, {})
         parameter_data = {
             DATA: {
                 DEFAULTS: {
-                    k: v
-                    for k, v in self.data.get(DEFAULTS, {}).items()
-                    if k.startswith("*") or k.startswith(f"{env_name}.")
+                    k: v for k, v in shared_data.items() if k.startswith(prefixes)
                 },
                 env_name: self.data[env_name],
             },
             SECRET_DATA: {
                 DEFAULTS: {
                     k: v
-                    for k, v in self.secret_data.get(DEFAULTS, {}).items()
-                    if k.startswith("*") or k.startswith(f"{env_name}.")
+                    for k, v in shared_secret_data.items()
+                    if k.startswith(prefixes)
                 },
-                env_name: self.secret_data[env_name],
+                env_name: self.secret_data.get(env_name, {}),
             },
         }
         return parameter_name, parameter_data
 
+    def _get_env_parameter_value(
+        self,
+        env_name: T.Union[str, "T_BASE_ENV_NAME_ENUM"],
+    ) -> tuple[str, str, str]:
+        """
+        Serialize the parameter data of an environment to JSON and hash it.
+
+        The result is cached per environment name, so deploying the same
+        environment multiple times only walks the config tree once.
+
+        :return: Tuple of parameter name, parameter value (JSON string)
+            and the SHA256 of the parameter value
+        """
+        env_name = self._ensure_env_name(env_name)
+        if env_name in self._parameter_value_cache:
+            return self._parameter_value_cache[env_name]
+        parameter_name, parameter_data = self._get_env_parameter_data(env_name)
+        # compact separators, SSM parameter value has a 4KB / 8KB size limit;
+        # keep the key order, ``_defaults`` rules are applied in written order
+        parameter_value = json.dumps(
+            parameter_data,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        config_sha256 = sha256_of_text(parameter_value)
+        result = (parameter_name, parameter_value, config_sha256)
+        self._parameter_value_cache[env_name] = result
+        return result
+
     def deploy_env_parameter(
         self,
         ssm_client: "SSMClient",
@@ -552,25 +741,35 @@ class BaseConfig(
         :after_param s3_client: S3 client for backup storage
         :after_param s3dir_config: S3 directory for configuration backup
         :after_param env_name: Environment name or ALL for consolidated config
+        :after_param tier: Parameter tier, if not specified, the advanced tier is
+            used when the parameter value is larger than 4KB, otherwise
+            the AWS default (standard tier) is used
         :after_param tags: Additional AWS resource tags
         :return: DeploymentResult with operation details
 
         .. note::
             For deploying multiple environments with different AWS clients,
-            call this method separately for each environment.
+            call this method separately for each environment. For multiple
+            environments with the same clients, use :meth:`deploy_env_parameters`,
+            and reuse the same client objects rather than creating them per call.
         """
-        parameter_name, parameter_data = self._get_env_parameter_data(env_name)
-        parameter_value = json.dumps(parameter_data, ensure_ascii=False)
-        config_sha256 = sha256_of_text(parameter_value)
+        parameter_name, parameter_value, config_sha256 = self._get_env_parameter_value(
+            env_name
+        )
+        # standard tier rejects values larger than 4KB, use advanced tier instead
+        if (tier is OPT) and (
+            len(parameter_value.encode("utf-8")) > _STANDARD_TIER_MAX_SIZE
+        ):
+            tier = ParameterTier.ADVANCED
+        # build a new dict, so the caller's ``tags`` is not mutated
         if tags is None:
             tags = {}
-        new_tags = {
-            AwsTagKeyEnum.project_name.value: self.project_name,
-            AwsTagKeyEnum.env_name.value: env_name,
-            AwsTagKeyEnum.config_sha256.value: config_sha256,
+        tags = {
+            **tags,
+            _TAG_KEY_PROJECT_NAME: self.project_name,
+            _TAG_KEY_ENV_NAME: self._ensure_env_name(env_name),
+            _TAG_KEY_CONFIG_SHA256: config_sha256,
         }
-        tags.update(new_tags)
-        tags.update(new_tags)
         before_param, after_param = put_parameter_if_changed(
             ssm_client=ssm_client,
             name=parameter_name,
@@ -590,17 +789,12 @@ class BaseConfig(
                 s3dir_config=s3dir_config,
                 parameter_name=parameter_name,
             )
-            s3path_latest = s3_parameter.write(
-                s3_client=s3_client,
-                value=parameter_value,
-                version=None,
-                write_text_kwargs={"tags": tags},
-            )
-            s3path_versioned = s3_parameter.write(
+            s3path_latest, s3path_versioned = s3_parameter.write_latest_and_versioned(
                 s3_client=s3_client,
                 value=parameter_value,
                 version=after_param.version,
                 write_text_kwargs={"tags": tags},
+                config_sha256=config_sha256,
             )
             return DeploymentResult(
                 before_param=before_param,
@@ -619,6 +813,93 @@ class BaseConfig(
                 s3path_versioned=None,
             )
 
+    def deploy_env_parameters(
+        self,
+        ssm_client: "SSMClient",
+        s3_client: "S3Client",
+        s3dir_config: S3Path,
+        env_names: T.Iterable[T.Union[str, "T_BASE_ENV_NAME_ENUM"]] | None = None,
+        description: str | None = OPT,
+        type: ParameterType | None = OPT,
+        tier: ParameterTier | None = OPT,
+        key_id: str | None = OPT,
+        allowed_pattern: str | None = OPT,
+        tags: dict[str, str] | None = None,
+        policies: str | None = OPT,
+        data_type: str | None = OPT,
+        max_workers: int = 4,
+    ) -> list[DeploymentResult]:
+        """
+        Deploy multiple environments concurrently with the same AWS clients.
+
+        The current values of all parameters are fetched first with batched
+        ``GetParameters`` calls (10 per request), environments whose value is
+        unchanged are skipped without further API calls. The others are deployed
+        by :meth:`deploy_env_parameter` in a bounded thread pool, the boto3
+        clients are thread-safe and shared by all workers.
+        Since the work is dominated by SSM and S3 network round trips, the total
+        wall time is roughly the time of the slowest environment instead of the sum.
+
+        :after_param env_names: Environment names to deploy, default to all
+            environments in the configuration data (not including ALL)
+        :after_param max_workers: Maximum number of concurrent deployments, keep it
+            low to stay below the SSM PutParameter throughput limit
+        :return: List of DeploymentResult, in the same order as ``env_names``
+
+        .. note::
+            Throttled requests are retried by botocore. For large batches, create
+            the clients with ``botocore.config.Config(retries={"mode": "adaptive"})``.
+        """
+        if env_names is None:
+            env_names = [env_name for env_name in self.data if env_name != DEFAULTS]
+        env_names = [self._ensure_env_name(env_name) for env_name in env_names]
+        parameter_values = {
+            env_name: self._get_env_parameter_value(env_name) for env_name in env_names
+        }
+        # prefetch the current values in batch, unchanged environments are skipped.
+        # decrypt only for SecureString, the same rule as put_parameter_if_changed
+        existing_parameters = _get_parameters(
+            ssm_client=ssm_client,
+            names=[name for name, _, _ in parameter_values.values()],
+            with_decryption=type is ParameterType.SECURE_STRING,
+        )
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for env_name, parameter_value_tuple in parameter_values.items():
+                parameter_name, parameter_value, _ = parameter_value_tuple
+                before_param = existing_parameters.get(parameter_name)
+                is_unchanged = (before_param is not None) and (
+                    before_param.value == parameter_value
+                )
+                if is_unchanged:
+                    results[env_name] = DeploymentResult(
+                        before_param=before_param,
+                        after_param=None,
+                        s3dir_config=s3dir_config,
+                        s3path_latest=None,
+                        s3path_versioned=None,
+                    )
+                    continue
+                futures[env_name] = executor.submit(
+                    self.deploy_env_parameter,
+                    ssm_client=ssm_client,
+                    s3_client=s3_client,
+                    s3dir_config=s3dir_config,
+                    env_name=env_name,
+                    description=description,
+                    type=type,
+                    tier=tier,
+                    key_id=key_id,
+                    allowed_pattern=allowed_pattern,
+                    tags=tags,
+                    policies=policies,
+                    data_type=data_type,
+                )
+            for env_name, future in futures.items():
+                results[env_name] = future.result()
+        return [results[env_name] for env_name in env_names]
+
     def delete_env_parameter(
         self,
         ssm_client: "SSMClient",
@@ -644,7 +925,7 @@ class BaseConfig(
             SSM parameter deletion removes all versions. S3 serves as backup
             and is preserved by default unless explicitly deleted.
         """
-        parameter_name, _ = self._get_env_parameter_data(env_name)
+        parameter_name = self._get_env_parameter_name(env_name)
         delete_parameter(
             ssm_client=ssm_client,
             name=parameter_name,
@@ -709,7 +990,8 @@ class BaseConfig(
             version=None,
             read_text_kwargs=read_text_kwargs,
         )
-        parameter_data = json_loads(text)
+        # written by deploy_env_parameter, no comments to strip
+        parameter_data = json.loads(text)
         data = parameter_data[DATA]
         secret_data = parameter_data[SECRET_DATA]
         return data, secret_data
@@ -728,6 +1010,11 @@ class BaseConfig(
         :after_param with_decryption: Whether to decrypt secure string parameters
 
         :return: Tuple containing non-sensitive and sensitive configuration data
+
+        .. note::
+            Create the boto3 client once and reuse it across calls (e.g. at
+            module level in AWS Lambda, outside of the handler), creating a new
+            client per call re-resolves credentials and endpoints every time.
         """
         parameter = get_parameter(
             ssm_client=ssm_client,
@@ -736,7 +1023,8 @@ class BaseConfig(
         )
         if parameter is None:
             raise ValueError(f"SSM Parameter {parameter_name!r} doesn't exist!")
-        parameter_data = json_loads(parameter.value)
+        # written by deploy_env_parameter, no comments to strip
+        parameter_data = json.loads(parameter.value)
         data = parameter_data[DATA]
         secret_data = parameter_data[SECRET_DATA]
         return data, secret_data
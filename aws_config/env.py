@@ -23,6 +23,11 @@ from .vendor.strutils import slugify
 # modules from this submodule
 from .constants import AwsTagKeyEnum, EnvVarNameEnum
 
+# character sets used by validate_project_name, built once at import time
+_PROJECT_NAME_FIRST_CHARS = frozenset(string.ascii_lowercase)
+_PROJECT_NAME_LAST_CHARS = frozenset(string.ascii_lowercase + string.digits)
+_PROJECT_NAME_CHARS = frozenset(string.ascii_lowercase + string.digits + "_-")
+
 
 def validate_project_name(project_name: str):
     """
@@ -34,11 +39,11 @@ def validate_project_name(project_name: str):
     :after_param project_name: Project identifier to validate
     :raises ValueError: If name violates naming rules
     """
-    if project_name[0] not in string.ascii_lowercase:
+    if project_name[0] not in _PROJECT_NAME_FIRST_CHARS:
         raise ValueError("first letter of project_name has to be a-z!")
-    if project_name[-1] not in (string.ascii_lowercase + string.digits):
+    if project_name[-1] not in _PROJECT_NAME_LAST_CHARS:
         raise ValueError("last letter of project_name has to be a-z, 0-9!")
-    if len(set(project_name).difference(string.ascii_lowercase + string.digits + "_-")):
+    if not _PROJECT_NAME_CHARS.issuperset(project_name):
         raise ValueError("project_name can only has a-z, 0-9, - or _!")
 
 
@@ -65,7 +70,7 @@ def normalize_parameter_name(param_name: str) -> str:
     Reference:
         https://docs.aws.amazon.com/cli/latest/reference/ssm/put-parameter.html#options
     """
-    if param_name.startswith("aws") or param_name.startswith("ssm"):
+    if param_name.startswith(("aws", "ssm")):
         return f"p-{param_name}"
     else:
         return param_name
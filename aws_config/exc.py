@@ -23,3 +23,10 @@ class ParameterNotExists(Exception):
     Raised when a parameter does not exist in AWS Parameter Store.
     """
     pass
+
+
+class S3ObjectDeleteError(Exception):
+    """
+    Raised when AWS S3 fails to delete some objects in a batch delete.
+    """
+    pass
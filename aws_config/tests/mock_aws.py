@@ -66,7 +66,8 @@ class BaseMockAwsTest:
 
         cls.boto_ses: "boto3.Session" = cls.bsm.boto_ses
         context.attach_boto_session(cls.boto_ses)
-        cls.s3_client: "S3Client" = cls.boto_ses.client("s3")
+        # reuse the cached client of bsm, creating a new boto3 client is slow
+        cls.s3_client: "S3Client" = cls.bsm.s3_client
         cls.create_s3_bucket(bucket_name=cls.bucket)
 
     @classmethod
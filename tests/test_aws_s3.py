@@ -5,10 +5,12 @@ from aws_config.s3 import (
     read_text,
 )
 
+from unittest.mock import patch
+
 import pytest
 from s3pathlib import S3Path
 from aws_config.tests.mock_aws import BaseMockAwsTest
-from aws_config.exc import S3ObjectNotExist
+from aws_config.exc import S3ObjectNotExist, S3ObjectDeleteError
 
 
 class TestS3Parameter(BaseMockAwsTest):
@@ -145,6 +147,40 @@ class TestS3Parameter(BaseMockAwsTest):
         result_latest = s3_param.read(s3_client=self.s3_client, version=None)
         assert result_latest == config_data_2
 
+    def test_write_latest_and_versioned(self):
+        """Test writing the latest and versioned files in one call"""
+        s3dir_config = self.s3bucket_test_bucket.joinpath("config-latest-versioned")
+        parameter_name = "myapp-lv"
+
+        s3_param = S3Parameter(
+            s3dir_config=s3dir_config,
+            parameter_name=parameter_name,
+        )
+
+        config_data = '{"version": 3}'
+        s3path_latest, s3path_versioned = s3_param.write_latest_and_versioned(
+            s3_client=self.s3_client,
+            value=config_data,
+            version=3,
+        )
+        assert s3path_latest.uri == s3_param.get_s3path(None).uri
+        assert s3path_versioned.uri == s3_param.get_s3path(3).uri
+        assert s3_param.read(s3_client=self.s3_client, version=None) == config_data
+        assert s3_param.read(s3_client=self.s3_client, version=3) == config_data
+
+        # the precomputed sha256 is stored as is, instead of being recomputed
+        from aws_config.constants import S3MetadataKeyEnum
+
+        s3_param.write_latest_and_versioned(
+            s3_client=self.s3_client,
+            value=config_data,
+            version=3,
+            config_sha256="precomputed",
+        )
+        for version in [None, 3]:
+            metadata = s3_param.get_s3path(version).metadata
+            assert metadata[S3MetadataKeyEnum.CONFIG_SHA256.value] == "precomputed"
+
     def test_s3_parameter_with_write_text_kwargs(self):
         """Test S3Parameter write with additional kwargs"""
         s3dir_config = self.s3bucket_test_bucket.joinpath("config-kwargs")
@@ -495,6 +531,30 @@ class TestS3Parameter(BaseMockAwsTest):
         # Should have 2 unrelated files + some config files (exact count depends on implementation)
         assert len(remaining_objects) >= 2
 
+    def test_delete_last_method_with_errors(self):
+        """Test delete_last raises when S3 fails to delete some files"""
+        s3dir_config = self.s3bucket_test_bucket.joinpath("config-delete-last-errors")
+        parameter_name = "myapp-delete-errors"
+
+        s3_param = S3Parameter(
+            s3dir_config=s3dir_config,
+            parameter_name=parameter_name,
+        )
+        for i in range(1, 5):
+            s3_param.write(s3_client=self.s3_client, value="{}", version=i)
+
+        key = s3_param.get_s3path(1).key
+        response = {
+            "Errors": [{"Key": key, "Code": "AccessDenied", "Message": "Access Denied"}]
+        }
+        with patch.object(self.s3_client, "delete_objects", return_value=response):
+            with pytest.raises(S3ObjectDeleteError, match="AccessDenied"):
+                s3_param.delete_last(
+                    s3_client=self.s3_client,
+                    keep_last_n=1,
+                    purge_older_than_secs=0,
+                )
+
     def test(
         self,
         disable_logger,
@@ -1,16 +1,29 @@
 # -*- coding: utf-8 -*-
 
-from aws_config.config import BaseConfig, BaseEnvNameEnum
+import dataclasses
+from unittest.mock import patch
+
+from aws_config.config import BaseConfig, BaseEnvNameEnum, _fast_clone, _merge_into
 
 import pytest
 from pydantic import Field, ValidationError
-from configcraft.api import DEFAULTS
-from simple_aws_ssm_parameter_store.api import ParameterType
+from which_env.api import EnvNameValidationError
+from configcraft.api import DEFAULTS, deep_merge
+from simple_aws_ssm_parameter_store.api import (
+    ParameterType,
+    ParameterTier,
+    get_parameter_tags,
+)
+from aws_config.constants import AwsTagKeyEnum
+from aws_config.utils import sha256_of_text
 from aws_config.env import BaseEnv
 from aws_config.paths import dir_tmp
 from aws_config.tests.mock_aws import BaseMockAwsTest
 
-dir_tmp.mkdir(parents=True, exist_ok=True)
+
+@pytest.fixture(scope="module", autouse=True)
+def ensure_dir_tmp():
+    dir_tmp.mkdir(parents=True, exist_ok=True)
 
 
 class EnvNameEnum(BaseEnvNameEnum):
@@ -57,6 +70,139 @@ sample_secret_data = {
 }
 
 
+def test_fast_clone():
+    data = {"a": [1, {"b": "c"}], "d": (1, 2), "e": None}
+    cloned = _fast_clone(data)
+    assert cloned == data
+    assert cloned is not data
+    assert cloned["a"] is not data["a"]
+    assert cloned["a"][1] is not data["a"][1]
+
+
+def test_merge_into():
+    data1 = {"a": 1, "b": {"c": 1}, "users": [{"name": "alice"}, {"name": "bob"}]}
+    data2 = {"d": 2, "b": {"e": 2}, "users": [{"pwd": "a"}, {"pwd": "b"}]}
+    expected = deep_merge(data1, data2)
+    assert _merge_into(_fast_clone(data1), _fast_clone(data2)) == expected
+
+    with pytest.raises(ValueError):
+        _merge_into({"a": [{}]}, {"a": [{}, {}]})
+    with pytest.raises(TypeError):
+        _merge_into({"a": [1]}, {"a": [2]})
+    with pytest.raises(TypeError):
+        _merge_into({"a": 1}, {"a": {}})
+
+    # shared nested objects in data1 are copied, not modified in place
+    db = {"host": "h"}
+    servers = [{"host": "h"}]
+    data1 = {"dev": {"db": db, "servers": servers}, "prod": {"db": db}}
+    data2 = {"dev": {"db": {"pwd": "a"}, "servers": [{"pwd": "a"}]}}
+    _merge_into(data1, data2)
+    assert data1["dev"] == {
+        "db": {"host": "h", "pwd": "a"},
+        "servers": [{"host": "h", "pwd": "a"}],
+    }
+    assert data1["prod"] == {"db": {"host": "h"}}
+    assert db == {"host": "h"}
+    assert servers == [{"host": "h"}]
+
+
+def test_eq_ignores_cache():
+    kwargs = dict(
+        data=sample_data,
+        secret_data=sample_secret_data,
+        EnvClass=Env,
+        EnvNameEnumClass=EnvNameEnum,
+        version="0.1.1",
+    )
+    config1 = Config(**kwargs)
+    config2 = Config(**kwargs)
+    config1.get_env(EnvNameEnum.dev)
+    config1._get_env_parameter_value(EnvNameEnum.dev)
+    assert config1 == config2
+    assert repr(config1) == repr(config2)
+
+
+def test_override_parameter_name():
+    class MyConfig(BaseConfig[Env, EnvNameEnum]):
+        @property
+        def parameter_name(self) -> str:
+            return f"/{self.project_name_snake}/config"
+
+    @dataclasses.dataclass
+    class MyDataclassConfig(BaseConfig[Env, EnvNameEnum]):
+        @property
+        def parameter_name(self) -> str:
+            return f"/{self.project_name_snake}/config"
+
+    for config_class in [MyConfig, MyDataclassConfig]:
+        config = config_class(
+            data=sample_data,
+            secret_data=sample_secret_data,
+            EnvClass=Env,
+            EnvNameEnumClass=EnvNameEnum,
+            version="0.1.1",
+        )
+        assert config.project_name_snake == "my_app"
+        assert config.parameter_name == "/my_app/config"
+
+
+def test_shared_default_with_secret_data():
+    data = {
+        DEFAULTS: {
+            "*.project_name": "my_app",
+            "*.db": {"host": "h"},
+            "*.servers": [{"host": "h"}],
+        },
+        EnvNameEnum.dev: {"username": "alice"},
+        EnvNameEnum.prod: {"username": "bob"},
+    }
+    # only dev has a nested secret, it must not leak into prod
+    config = Config(
+        data=data,
+        secret_data={
+            EnvNameEnum.dev: {"password": "devpw", "db": {"password": "devpw"}},
+            EnvNameEnum.prod: {"password": "prodpw"},
+        },
+        EnvClass=Env,
+        EnvNameEnumClass=EnvNameEnum,
+        version="0.1.1",
+    )
+    assert config._merged_data[EnvNameEnum.dev]["db"] == {
+        "host": "h",
+        "password": "devpw",
+    }
+    assert config._merged_data[EnvNameEnum.prod]["db"] == {"host": "h"}
+
+    # both environments have a nested secret in the shared dict and list
+    config = Config(
+        data=data,
+        secret_data={
+            EnvNameEnum.dev: {
+                "password": "devpw",
+                "db": {"password": "devpw"},
+                "servers": [{"password": "devpw"}],
+            },
+            EnvNameEnum.prod: {
+                "password": "prodpw",
+                "db": {"password": "prodpw"},
+                "servers": [{"password": "prodpw"}],
+            },
+        },
+        EnvClass=Env,
+        EnvNameEnumClass=EnvNameEnum,
+        version="0.1.1",
+    )
+    for env_name, password in [
+        (EnvNameEnum.dev, "devpw"),
+        (EnvNameEnum.prod, "prodpw"),
+    ]:
+        env_data = config._merged_data[env_name]
+        assert env_data["db"] == {"host": "h", "password": password}
+        assert env_data["servers"] == [{"host": "h", "password": password}]
+    assert data[DEFAULTS]["*.db"] == {"host": "h"}
+
+
 class TestConfig(BaseMockAwsTest):
     def test_happy_path(self):
         config = Config(
@@ -67,6 +213,7 @@ class TestConfig(BaseMockAwsTest):
             version="0.1.1",
         )
         env = config.get_env(EnvNameEnum.dev)
+        assert config.get_env("dev") is env
         assert env.env_name == "dev"
         assert env.username == "alice"
         assert env.password == "alicepassword"
@@ -75,6 +222,58 @@ class TestConfig(BaseMockAwsTest):
         assert config.project_name_slug == "my-app"
         assert config.parameter_name == "my_app"
 
+    def test_empty_secret_data(self):
+        config = Config(
+            data=sample_data,
+            secret_data={},
+            EnvClass=Env,
+            EnvNameEnumClass=EnvNameEnum,
+            version="0.1.1",
+        )
+        assert config._merged_data["dev"]["username"] == "alice"
+        assert "password" not in config._merged_data["dev"]
+
+        class PublicEnv(BaseEnv):
+            username: str = Field()
+
+        # a config without secret data can be serialized and deployed
+        config = Config(
+            data=sample_data,
+            secret_data={},
+            EnvClass=PublicEnv,
+            EnvNameEnumClass=EnvNameEnum,
+            version="0.1.1",
+        )
+        s3dir_config = self.s3dir_root.joinpath("config-no-secret").to_dir()
+        result = config.deploy_env_parameter(
+            ssm_client=self.bsm.ssm_client,
+            s3_client=self.bsm.s3_client,
+            s3dir_config=s3dir_config,
+            env_name=EnvNameEnum.dev,
+            type=ParameterType.STRING,
+        )
+        assert result.is_ssm_deployed
+        data, secret_data = Config.load_parameter(
+            ssm_client=self.bsm.ssm_client,
+            parameter_name="my_app-dev",
+        )
+        assert secret_data == {DEFAULTS: {}, "dev": {}}
+        loaded_config = Config(
+            data=data,
+            secret_data=secret_data,
+            EnvClass=PublicEnv,
+            EnvNameEnumClass=EnvNameEnum,
+            version="0.1.1",
+        )
+        assert loaded_config.get_env(EnvNameEnum.dev).username == "alice"
+        config.delete_env_parameter(
+            ssm_client=self.bsm.ssm_client,
+            env_name=EnvNameEnum.dev,
+            s3_client=self.bsm.s3_client,
+            s3dir_config=s3dir_config,
+            include_s3=True,
+        )
+
     def test_validation_error(self):
         config = Config(
             data={
@@ -103,6 +302,22 @@ class TestConfig(BaseMockAwsTest):
         with pytest.raises(ValidationError):
             env = config.get_env(EnvNameEnum.dev)
 
+    def test_invalid_env_name_enum_value(self):
+        class BadEnvNameEnum(BaseEnvNameEnum):
+            Dev = "Dev"
+
+        with pytest.raises(EnvNameValidationError):
+            Config(
+                data={
+                    DEFAULTS: {"*.project_name": "my_app"},
+                    BadEnvNameEnum.Dev: {"username": "alice"},
+                },
+                secret_data={},
+                EnvClass=Env,
+                EnvNameEnumClass=BadEnvNameEnum,
+                version="0.1.1",
+            )
+
     def test_deploy_env_parameter(self):
         config = Config(
             data=sample_data,
@@ -128,6 +343,21 @@ class TestConfig(BaseMockAwsTest):
         assert result.parameter_name == "my_app-dev"
         assert result.version == 1
 
+        # All tag keys and values must be plain strings
+        expected_tags = {
+            AwsTagKeyEnum.project_name.value: "my_app",
+            AwsTagKeyEnum.env_name.value: "dev",
+        }
+        ssm_tags = get_parameter_tags(ssm_client=ssm_client, name="my_app-dev")
+        _, s3_tags = result.s3path_latest.get_tags(bsm=s3_client)
+        for tags in [ssm_tags, s3_tags]:
+            assert all(type(k) is str and type(v) is str for k, v in tags.items())
+            for k, v in expected_tags.items():
+                assert tags[k] == v
+            assert tags[AwsTagKeyEnum.config_sha256.value] == sha256_of_text(
+                result.after_param.value
+            )
+
         # Second deployment with same data - should skip (no changes)
         result = config.deploy_env_parameter(
             ssm_client=ssm_client,
@@ -186,6 +416,164 @@ class TestConfig(BaseMockAwsTest):
             include_s3=True,
         )
 
+    def test_deploy_env_parameters(self):
+        config = Config(
+            data=sample_data,
+            secret_data=sample_secret_data,
+            EnvClass=Env,
+            EnvNameEnumClass=EnvNameEnum,
+            version="0.1.1",
+        )
+        s3dir_config = self.s3dir_root.joinpath("config-many").to_dir()
+        results = config.deploy_env_parameters(
+            ssm_client=self.bsm.ssm_client,
+            s3_client=self.bsm.s3_client,
+            s3dir_config=s3dir_config,
+            type=ParameterType.SECURE_STRING,
+        )
+        assert [result.parameter_name for result in results] == [
+            "my_app-dev",
+            "my_app-prod",
+        ]
+        assert all(result.is_ssm_deployed for result in results)
+        assert all(result.is_s3_deployed for result in results)
+
+        # Re-deploy with same data - unchanged environments are skipped
+        results = config.deploy_env_parameters(
+            ssm_client=self.bsm.ssm_client,
+            s3_client=self.bsm.s3_client,
+            s3dir_config=s3dir_config,
+            env_names=[EnvNameEnum.prod, EnvNameEnum.dev],
+            type=ParameterType.SECURE_STRING,
+        )
+        assert [result.parameter_name for result in results] == [
+            "my_app-prod",
+            "my_app-dev",
+        ]
+        assert not any(result.is_ssm_deployed for result in results)
+        assert not any(result.is_s3_deployed for result in results)
+        assert all(result.version == 1 for result in results)
+
+        # unchanged SecureString values are matched by the batched prefetch,
+        # no per-environment deploy is needed
+        with patch(
+            "aws_config.config.put_parameter_if_changed"
+        ) as mock_put_parameter_if_changed:
+            results = config.deploy_env_parameters(
+                ssm_client=self.bsm.ssm_client,
+                s3_client=self.bsm.s3_client,
+                s3dir_config=s3dir_config,
+                type=ParameterType.SECURE_STRING,
+            )
+        mock_put_parameter_if_changed.assert_not_called()
+        assert not any(result.is_ssm_deployed for result in results)
+
+        for env_name in EnvNameEnum:
+            config.delete_env_parameter(
+                ssm_client=self.bsm.ssm_client,
+                env_name=env_name,
+                s3_client=self.bsm.s3_client,
+                s3dir_config=s3dir_config,
+                include_s3=True,
+            )
+
+    def test_deploy_and_load_keeps_defaults_order(self):
+        # "exception-then-default": the specific rule has to come first
+        data = {
+            DEFAULTS: {
+                "*.project_name": "my_app",
+                "*.servers.blue.cpu": 4,
+                "*.servers.*.cpu": 2,
+            },
+            EnvNameEnum.dev: {
+                "username": "alice",
+                "servers": {"blue": {}, "green": {}},
+            },
+            EnvNameEnum.prod: {
+                "username": "bob",
+                "servers": {"blue": {}, "green": {}},
+            },
+        }
+        config = Config(
+            data=data,
+            secret_data=sample_secret_data,
+            EnvClass=Env,
+            EnvNameEnumClass=EnvNameEnum,
+            version="0.1.1",
+        )
+        servers = config._merged_data[EnvNameEnum.dev]["servers"]
+        assert servers == {"blue": {"cpu": 4}, "green": {"cpu": 2}}
+
+        s3dir_config = self.s3dir_root.joinpath("config-order").to_dir()
+        config.deploy_env_parameter(
+            ssm_client=self.bsm.ssm_client,
+            s3_client=self.bsm.s3_client,
+            s3dir_config=s3dir_config,
+            env_name=EnvNameEnum.dev,
+            type=ParameterType.SECURE_STRING,
+        )
+        loaded_data_list = [
+            Config.load_parameter(
+                ssm_client=self.bsm.ssm_client,
+                parameter_name="my_app-dev",
+                with_decryption=True,
+            ),
+            Config.load_from_s3(
+                s3_client=self.bsm.s3_client,
+                s3dir_config=s3dir_config,
+                parameter_name="my_app-dev",
+            ),
+        ]
+        for loaded_data, loaded_secret_data in loaded_data_list:
+            loaded_config = Config(
+                data=loaded_data,
+                secret_data=loaded_secret_data,
+                EnvClass=Env,
+                EnvNameEnumClass=EnvNameEnum,
+                version="0.1.1",
+            )
+            loaded_servers = loaded_config._merged_data[EnvNameEnum.dev]["servers"]
+            assert loaded_servers == servers
+
+        config.delete_env_parameter(
+            ssm_client=self.bsm.ssm_client,
+            env_name=EnvNameEnum.dev,
+            s3_client=self.bsm.s3_client,
+            s3dir_config=s3dir_config,
+            include_s3=True,
+        )
+
+    def test_deploy_env_parameter_large_value(self):
+        config = Config(
+            data=sample_data,
+            secret_data={
+                EnvNameEnum.dev: {"password": "x" * 5000},
+                EnvNameEnum.prod: {"password": "bobpassword"},
+            },
+            EnvClass=Env,
+            EnvNameEnumClass=EnvNameEnum,
+            version="0.1.1",
+        )
+        s3dir_config = self.s3dir_root.joinpath("config-large").to_dir()
+        # value larger than 4KB is deployed to the advanced tier automatically
+        result = config.deploy_env_parameter(
+            ssm_client=self.bsm.ssm_client,
+            s3_client=self.bsm.s3_client,
+            s3dir_config=s3dir_config,
+            env_name=EnvNameEnum.dev,
+            type=ParameterType.SECURE_STRING,
+        )
+        assert result.is_ssm_deployed
+        assert result.after_param.tier == ParameterTier.ADVANCED.value
+
+        config.delete_env_parameter(
+            ssm_client=self.bsm.ssm_client,
+            env_name=EnvNameEnum.dev,
+            s3_client=self.bsm.s3_client,
+            s3dir_config=s3dir_config,
+            include_s3=True,
+        )
+
 
 if __name__ == "__main__":
     from aws_config.tests import run_cov_test
@@ -14,6 +14,9 @@ def test_sha256_of_text():
 
 def test_sha256_of_config_data():
     _ = sha256_of_config_data({"name": "Alice"})
+    assert sha256_of_config_data({"a": 1, "b": 2}) == sha256_of_config_data(
+        {"b": 2, "a": 1}
+    )
 
 
 def test_encode_version():